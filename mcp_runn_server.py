@@ -11,82 +11,176 @@ Usage:
 
 Tools:
   - list_projects() -> list of {id, name}
-  - list_people(full=False, params=None, paginate=True, limit=200) -> list of {id, name, email} by default
+  - list_people(full=False, params=None, paginate=True, limit=500, output_format="json")
+      -> list of {id, name, email} by default
   - billable_hours(start=None, end=None, project_id=None, person_id=None)
       returns aggregated billable hours grouped by project/person/month
-  - list_clients(params=None, paginate=True, limit=200)
-  - list_assignments(params=None, paginate=True, limit=200)
+  - list_clients(params=None, paginate=True, limit=500)
+  - list_assignments(params=None, paginate=True, limit=500, output_format="json")
   - list_assignments_by_person(person_id, start=None, end=None, active_only=False)
   - list_assignments_by_project(project_id, start=None, end=None, active_only=False)
   - list_assignments_by_role(role_id, start=None, end=None, active_only=False)
   - list_assignments_by_team(team_id, start=None, end=None, active_only=False, include_archived=False)
-  - list_actuals(params=None, paginate=True, limit=200)
+  - list_actuals(params=None, paginate=True, limit=500, output_format="json")
   - list_actuals_by_date_range(start, end, person_id=None, project_id=None)
   - list_actuals_by_person(person_id, start=None, end=None)
   - list_actuals_by_project(project_id, start=None, end=None)
   - list_actuals_by_role(role_id, start=None, end=None)
   - list_actuals_by_team(team_id, start=None, end=None, include_archived=False)
-  - list_roles(params=None, paginate=True, limit=200)
+  - list_roles(params=None, paginate=True, limit=500)
   - list_roles_by_person(person_id)
-  - list_skills(params=None, paginate=True, limit=200)
+  - list_skills(params=None, paginate=True, limit=500)
   - list_skills_by_person(person_id)
-  - list_teams(params=None, paginate=True, limit=200)
+  - list_teams(params=None, paginate=True, limit=500)
   - list_people_by_team(team_id, include_archived=False)
   - list_people_by_skill(skill_id, min_level=None, include_archived=False)
   - list_people_by_tag(tag_id=None, tag_name=None, include_archived=False)
   - list_people_by_manager(manager_id, include_archived=False)
-  - list_rate_cards(params=None, paginate=True, limit=200)
+  - list_rate_cards(params=None, paginate=True, limit=500)
   - list_rate_cards_by_project(project_id)
-  - runn_request(method, path, params=None, json_body=None, paginate=False, limit=200)
+  - runn_request(method, path, params=None, json_body=None, paginate=False, limit=500)
       calls any Runn API endpoint (optionally paginated for list endpoints)
+  - cache_clear() -> drops cached list responses
 
 Notes:
   - Requires env RUNN_API_KEY.
+  - Tools are async; blocking Runn calls run in worker threads so concurrent calls overlap.
   - Uses existing RunnClient from runn_reports.py.
+  - List responses are cached in-process for RUNN_CACHE_TTL seconds (default 60; 0 disables); writes sent
+    through runn_request clear the cache.
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import datetime as dt
+import functools
 import os
-from typing import Dict, List, Optional
-
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+import requests
 from mcp.server.fastmcp import FastMCP
 
-from runn_reports import RunnClient, build_billable_hours_report, parse_date
+from runn_reports import (
+    ACTUALS_FILTER_PARAMS,
+    ASSIGNMENTS_FILTER_PARAMS,
+    DEFAULT_PAGE_SIZE,
+    RunnClient,
+    build_billable_hours_report,
+    parse_date,
+    people_names,
+    project_names,
+)
+
+
+CACHE_MAXSIZE = 64
+CACHE_TTL_SECONDS = float(os.getenv("RUNN_CACHE_TTL", "60"))
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: object) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+
+_MISSING = object()
+_list_cache = _TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS)
 
 
 def get_client(api_key: Optional[str] = None) -> RunnClient:
-    key = api_key or os.getenv("RUNN_API_KEY")
-    # Try to read from .vscode/mcp.json if not set
-    if not key:
-        import json
-        import pathlib
-        mcp_json_path = pathlib.Path(__file__).parent.parent / ".vscode" / "mcp.json"
-        if mcp_json_path.exists():
-            try:
-                with open(mcp_json_path, "r", encoding="utf-8") as f:
-                    mcp_config = json.load(f)
-                # Traverse to Authorization header if present
-                key = (
-                    mcp_config.get("servers", {})
-                    .get("runn-local", {})
-                    .get("headers", {})
-                    .get("Authorization")
-                )
-            except Exception:
-                pass
+    # Fall back to .vscode/mcp.json if neither an explicit key nor RUNN_API_KEY is set
+    key = api_key or os.getenv("RUNN_API_KEY") or _key_from_mcp_json()
     if not key:
         raise RuntimeError("RUNN_API_KEY not set and not found in mcp.json headers")
-    return RunnClient(api_key=key)
-
-
-def _list_endpoint(
+    return _client_for_key(key)
+
+
+@functools.lru_cache(maxsize=1)
+def _key_from_mcp_json() -> Optional[str]:
+    import json
+    import pathlib
+
+    mcp_json_path = pathlib.Path(__file__).parent.parent / ".vscode" / "mcp.json"
+    if not mcp_json_path.exists():
+        return None
+    try:
+        with open(mcp_json_path, "r", encoding="utf-8") as f:
+            mcp_config = json.load(f)
+        # Traverse to Authorization header if present
+        return (
+            mcp_config.get("servers", {})
+            .get("runn-local", {})
+            .get("headers", {})
+            .get("Authorization")
+        )
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _client_for_key(api_key: str) -> RunnClient:
+    # One client per key so its session (and pooled TLS connections) is reused across tool calls.
+    return RunnClient(api_key=api_key)
+
+
+def _cache_key(
+    client: RunnClient,
+    path: str,
+    params: Optional[Dict[str, object]],
+    paginate: bool,
+    limit: int,
+) -> Optional[Hashable]:
+    frozen = tuple(sorted((params or {}).items()))
+    try:
+        hash(frozen)
+    except TypeError:
+        return None
+    return (client.base_url, client.api_key, path, frozen, paginate, limit)
+
+
+def _fetch_endpoint(
     client: RunnClient,
     path: str,
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
 ) -> object:
     if paginate:
         return list(client.paginate(path, params=params, limit=limit))
@@ -96,37 +190,397 @@ def _list_endpoint(
     return resp
 
 
-def _to_date(value: Optional[str]) -> Optional[dt.date]:
-    return parse_date(value) if value else None
+def _list_endpoint(
+    client: RunnClient,
+    path: str,
+    params: Optional[Dict[str, object]] = None,
+    paginate: bool = True,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> object:
+    # Single pages fetched with custom params (e.g. cursors) are not worth caching.
+    key = _cache_key(client, path, params, paginate, limit) if paginate or not params else None
+    if key is not None:
+        cached = _list_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return list(cached) if isinstance(cached, list) else cached
+
+    result = _fetch_endpoint(client, path, params=params, paginate=paginate, limit=limit)
+    if key is not None:
+        _list_cache.set(key, result)
+        if isinstance(result, list):
+            return list(result)
+    return result
+
+
+def _iter_endpoint(
+    client: RunnClient,
+    path: str,
+    params: Optional[Dict[str, object]] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Dict[str, object]]:
+    """Yield every row of a list endpoint without copying it, for tools that only filter.
+
+    Rows come from the cache when it is warm; otherwise they are streamed page by page and
+    the collection is cached once fully consumed.
+    """
+    key = _cache_key(client, path, params, True, limit)
+    cached = _list_cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        yield from cached
+        return
+    rows = []
+    for row in client.paginate(path, params=params, limit=limit):
+        rows.append(row)
+        yield row
+    _list_cache.set(key, rows)
+
+
+# Dates are compared as proleptic Gregorian ordinals (plain ints) rather than date objects.
+_MIN_ORD = dt.date.min.toordinal()
+_MAX_ORD = dt.date.max.toordinal()
+
+
+@functools.lru_cache(maxsize=4096)
+def _ord(value: str) -> int:
+    return dt.date.fromisoformat(value).toordinal()
+
+
+_OUTPUT_FORMATS = ("json", "ndjson")
+
+
+def _check_output_format(output_format: str) -> None:
+    if output_format not in _OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of {', '.join(_OUTPUT_FORMATS)}.")
+
+
+def _render_rows(rows: object, output_format: str) -> object:
+    """Return rows as-is for json, or as one compact newline-delimited JSON string for ndjson.
+
+    Large lists are otherwise converted to one indented text block per row by FastMCP.
+    """
+    if output_format == "ndjson" and isinstance(rows, list):
+        return b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows).decode()
+    return rows
+
+
+def _to_ord(value: Optional[str]) -> Optional[int]:
+    return _ord(value) if value else None
+
+
+def _span(start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+    """Normalize an optional ordinal range to closed bounds; a fully open range spans all dates."""
+    if start is None and end is None:
+        return _MIN_ORD, _MAX_ORD
+    if end is None:
+        end = start
+    if start is None:
+        start = end
+    return start, end
+
+
+@dataclass(slots=True)
+class _CollectionIndex:
+    """Rows of a list endpoint plus id buckets and pre-parsed dates, built once per cache TTL."""
+
+    rows: List[Dict[str, object]]
+    by_person: Dict[object, List[int]]
+    by_project: Dict[object, List[int]]
+    by_role: Dict[object, List[int]]
+    # Per-row columns read by the filter predicates, so they never touch the row dicts.
+    active: List[bool]
+    start_ords: List[Optional[int]]
+    # Closed (start, end) bounds per row, normalized by _span for overlap tests.
+    span_starts: List[int]
+    span_ends: List[int]
+    # Positions of dated rows ordered by start date, with the sorted dates alongside for bisect.
+    start_order: List[int]
+    sorted_starts: List[int]
+
+    def positions_between(self, start: Optional[int], end: Optional[int]) -> List[int]:
+        """Positions (in row order) whose start date falls within [start, end]."""
+        lo = bisect.bisect_left(self.sorted_starts, start) if start is not None else 0
+        hi = bisect.bisect_right(self.sorted_starts, end) if end is not None else len(self.sorted_starts)
+        return sorted(self.start_order[lo:hi])
+
+
+def _compile_filter(
+    idx: _CollectionIndex,
+    start: Optional[int],
+    end: Optional[int],
+    overlap: bool,
+    active_only: bool = False,
+    dated_only: bool = False,
+) -> Optional[Callable[[int], bool]]:
+    """Build a position predicate specialized to the requested filters (None when nothing to filter).
+
+    overlap=True tests the row span against [start, end] (assignments); otherwise the row's
+    start date must fall inside it and undated rows never match (actuals). With an open range
+    undated rows are kept unless dated_only is set.
+    """
+    active = idx.active
+    lo = _MIN_ORD if start is None else start
+    hi = _MAX_ORD if end is None else end
+    if start is None and end is None:
+        if dated_only and not overlap:
+            start_ords = idx.start_ords
+            if active_only:
+                return lambda i: active[i] and start_ords[i] is not None
+            return lambda i: start_ords[i] is not None
+        if active_only:
+            return lambda i: active[i]
+        return None
+    if overlap:
+        span_starts = idx.span_starts
+        span_ends = idx.span_ends
+        if active_only:
+            return lambda i: active[i] and span_ends[i] >= lo and span_starts[i] <= hi
+        return lambda i: span_ends[i] >= lo and span_starts[i] <= hi
+    start_ords = idx.start_ords
+    if active_only:
+        return lambda i: active[i] and start_ords[i] is not None and lo <= start_ords[i] <= hi
+    return lambda i: start_ords[i] is not None and lo <= start_ords[i] <= hi
+
+
+def _build_index(source: Iterable[Dict[str, object]], start_field: str, end_field: str) -> _CollectionIndex:
+    rows = []
+    by_person: Dict[object, List[int]] = defaultdict(list)
+    by_project: Dict[object, List[int]] = defaultdict(list)
+    by_role: Dict[object, List[int]] = defaultdict(list)
+    active = []
+    start_ords = []
+    span_starts = []
+    span_ends = []
+    for i, row in enumerate(source):
+        rows.append(row)
+        by_person[row.get("personId")].append(i)
+        by_project[row.get("projectId")].append(i)
+        by_role[row.get("roleId")].append(i)
+        active.append(bool(row.get("isActive", False)))
+        row_start = _to_ord(row.get(start_field))
+        row_lo, row_hi = _span(row_start, _to_ord(row.get(end_field)))
+        start_ords.append(row_start)
+        span_starts.append(row_lo)
+        span_ends.append(row_hi)
+    dated = sorted((d, i) for i, d in enumerate(start_ords) if d is not None)
+    return _CollectionIndex(
+        rows=rows,
+        by_person=dict(by_person),
+        by_project=dict(by_project),
+        by_role=dict(by_role),
+        active=active,
+        start_ords=start_ords,
+        span_starts=span_starts,
+        span_ends=span_ends,
+        start_order=[i for _, i in dated],
+        sorted_starts=[d for d, _ in dated],
+    )
 
 
-def _in_range(date_value: Optional[dt.date], start: Optional[dt.date], end: Optional[dt.date]) -> bool:
-    if date_value is None:
-        return False
-    if start and date_value < start:
-        return False
-    if end and date_value > end:
-        return False
-    return True
+def _indexed_collection(
+    client: RunnClient,
+    path: str,
+    start_field: str,
+    end_field: str,
+    params: Optional[Dict[str, object]] = None,
+) -> _CollectionIndex:
+    key = ("index", client.base_url, client.api_key, path, tuple(sorted((params or {}).items())))
+    idx = _list_cache.get(key)
+    if idx is None:
+        idx = _build_index(_iter_endpoint(client, path, params=params), start_field, end_field)
+        _list_cache.set(key, idx)
+    return idx
 
 
-def _range_overlaps(
-    start_a: Optional[dt.date],
-    end_a: Optional[dt.date],
-    start_b: Optional[dt.date],
-    end_b: Optional[dt.date],
-) -> bool:
-    if start_a is None and end_a is None:
+def _query_index(
+    client: RunnClient,
+    path: str,
+    start_field: str,
+    end_field: str,
+    supported: Dict[str, str],
+    **filters: object,
+) -> _CollectionIndex:
+    """Index to answer a filtered query, pushing supported filters down to the API.
+
+    A warm index of the full collection is reused as-is. Otherwise only the rows matching
+    the supported filters are fetched; callers still apply every filter client-side, so an
+    endpoint that ignores a filter only costs bandwidth.
+    """
+    full_key = ("index", client.base_url, client.api_key, path, ())
+    idx = _list_cache.get(full_key)
+    if idx is not None:
+        return idx
+    params = {
+        supported[name]: value for name, value in filters.items() if name in supported and value not in (None, "")
+    }
+    if not params:
+        return _indexed_collection(client, path, start_field, end_field)
+    try:
+        return _indexed_collection(client, path, start_field, end_field, params=params)
+    except requests.HTTPError as exc:
+        if exc.response is None or exc.response.status_code not in (400, 422):
+            raise
+    return _indexed_collection(client, path, start_field, end_field)
+
+
+# path -> (start field, end field, server-side filters, overlap semantics for the date range)
+_COLLECTIONS = {
+    "/assignments": ("startDate", "endDate", ASSIGNMENTS_FILTER_PARAMS, True),
+    "/actuals": ("date", "date", ACTUALS_FILTER_PARAMS, False),
+}
+_ID_BUCKETS = {"person_id": "by_person", "project_id": "by_project", "role_id": "by_role"}
+
+
+def _query(
+    client: RunnClient,
+    path: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    active_only: bool = False,
+    person_ids: Optional[FrozenSet[object]] = None,
+    dated_only: bool = False,
+    **id_filters: Optional[int],
+) -> List[Dict[str, object]]:
+    """Rows of /assignments or /actuals matching every id filter, person_ids, the date range and active_only.
+
+    dated_only drops undated actuals even when the range is open.
+    """
+    start_field, end_field, supported, overlap = _COLLECTIONS[path]
+    # Parse the range first so malformed dates fail before any request is sent.
+    start_ord = _to_ord(start)
+    end_ord = _to_ord(end)
+    idx = _query_index(client, path, start_field, end_field, supported, start=start, end=end, **id_filters)
+
+    buckets = [
+        getattr(idx, _ID_BUCKETS[name]).get(value, []) for name, value in id_filters.items() if value is not None
+    ]
+    if person_ids is not None:
+        buckets.append(sorted(i for pid in person_ids for i in idx.by_person.get(pid, [])))
+    if buckets:
+        # Intersect from the smallest bucket; every bucket is in row order, so the result is too.
+        buckets.sort(key=len)
+        positions = buckets[0]
+        for other in buckets[1:]:
+            keep = frozenset(other)
+            positions = [i for i in positions if i in keep]
+    elif overlap:
+        positions = range(len(idx.rows))
+    else:
+        positions = idx.positions_between(start_ord, end_ord)
+
+    matches = _compile_filter(
+        idx, start_ord, end_ord, overlap=overlap, active_only=active_only, dated_only=dated_only
+    )
+    if matches is not None:
+        positions = filter(matches, positions)
+    return [idx.rows[i] for i in positions]
+
+
+def _meets_level(level: object, min_level: Optional[int]) -> bool:
+    if min_level is None:
         return True
-    if end_a is None:
-        end_a = start_a
-    if start_a is None:
-        start_a = end_a
-    if start_b and end_a and end_a < start_b:
+    if level is None:
         return False
-    if end_b and start_a and start_a > end_b:
+    try:
+        return int(level) >= int(min_level)
+    except (TypeError, ValueError):
         return False
-    return True
+
+
+@dataclass(slots=True)
+class _PeopleIndex:
+    """People rows plus inverted manager/tag/skill indexes, built once per cache TTL."""
+
+    people: List[Dict[str, object]]
+    by_team: Dict[object, List[int]]
+    by_manager: Dict[object, List[int]]
+    by_tag_id: Dict[object, List[int]]
+    # Keyed by lowercased tag name.
+    by_tag_name: Dict[str, List[int]]
+    # Skill id -> (position, level) for every skill entry.
+    by_skill: Dict[object, List[Tuple[int, object]]]
+
+    def select(self, positions: Iterable[int], include_archived: bool) -> List[Dict[str, object]]:
+        """Rows for the given positions in API order, deduplicated, optionally dropping archived people."""
+        people = self.people
+        return [
+            people[i] for i in sorted(set(positions)) if include_archived or not people[i].get("isArchived")
+        ]
+
+
+def _people_index(client: RunnClient) -> _PeopleIndex:
+    key = ("people-index", client.base_url, client.api_key)
+    idx = _list_cache.get(key)
+    if idx is not None:
+        return idx
+
+    people = []
+    by_team: Dict[object, List[int]] = defaultdict(list)
+    by_manager: Dict[object, List[int]] = defaultdict(list)
+    by_tag_id: Dict[object, List[int]] = defaultdict(list)
+    by_tag_name: Dict[str, List[int]] = defaultdict(list)
+    by_skill: Dict[object, List[Tuple[int, object]]] = defaultdict(list)
+    for i, person in enumerate(_iter_endpoint(client, "/people")):
+        people.append(person)
+        by_team[person.get("teamId")].append(i)
+        for manager in person.get("managers") or []:
+            by_manager[manager.get("id")].append(i)
+        tags = person.get("tags") or []
+        # Lowercase names once at ingest and bucket each person once per distinct tag.
+        for tag_id in {tag.get("id") for tag in tags}:
+            by_tag_id[tag_id].append(i)
+        for tag_name in {str(tag.get("name", "")).lower() for tag in tags}:
+            by_tag_name[tag_name].append(i)
+        for skill in person.get("skills") or []:
+            by_skill[skill.get("id")].append((i, skill.get("level")))
+
+    idx = _PeopleIndex(
+        people=people,
+        by_team=dict(by_team),
+        by_manager=dict(by_manager),
+        by_tag_id=dict(by_tag_id),
+        by_tag_name=dict(by_tag_name),
+        by_skill=dict(by_skill),
+    )
+    _list_cache.set(key, idx)
+    return idx
+
+
+def _person_names(client: RunnClient) -> Dict[int, str]:
+    """Person id -> display name, built from the cached people index rather than a fresh /people fetch."""
+    key = ("person-names", client.base_url, client.api_key)
+    names = _list_cache.get(key)
+    if names is None:
+        names = people_names(_people_index(client).people)
+        _list_cache.set(key, names)
+    return names
+
+
+def _project_names(client: RunnClient) -> Dict[int, str]:
+    key = ("project-names", client.base_url, client.api_key)
+    names = _list_cache.get(key)
+    if names is None:
+        names = project_names(_iter_endpoint(client, "/projects"))
+        _list_cache.set(key, names)
+    return names
+
+
+def _sorted_projects(client: RunnClient) -> List[Dict[str, object]]:
+    """{id, name} for every project, sorted by id and cached so list_projects neither refetches nor re-sorts."""
+    key = ("projects-sorted", client.base_url, client.api_key)
+    projects = _list_cache.get(key)
+    if projects is None:
+        projects = [{"id": pid, "name": name} for pid, name in sorted(_project_names(client).items())]
+        _list_cache.set(key, projects)
+    return projects
+
+
+def _skill_names(client: RunnClient) -> Dict[object, object]:
+    key = ("skill-names", client.base_url, client.api_key)
+    names = _list_cache.get(key)
+    if names is None:
+        names = {s.get("id"): s.get("name") for s in _iter_endpoint(client, "/skills")}
+        _list_cache.set(key, names)
+    return names
 
 
 def _people_ids_for_team(
@@ -134,77 +588,60 @@ def _people_ids_for_team(
     team_id: int,
     include_archived: bool = False,
 ) -> List[int]:
-    people = _list_endpoint(client, "/people", paginate=True)
-    ids = []
-    for p in people:
-        if p.get("teamId") != team_id:
-            continue
-        if not include_archived and p.get("isArchived"):
-            continue
-        ids.append(p["id"])
-    return ids
-
-
-def _person_has_tag(person: Dict[str, object], tag_id: Optional[int], tag_name: Optional[str]) -> bool:
-    tags = person.get("tags") or []
-    tag_name_norm = tag_name.lower() if isinstance(tag_name, str) else None
-    for tag in tags:
-        if tag_id is not None and tag.get("id") == tag_id:
-            return True
-        if tag_name_norm and str(tag.get("name", "")).lower() == tag_name_norm:
-            return True
-    return False
-
-
-def _person_has_skill(person: Dict[str, object], skill_id: int, min_level: Optional[int]) -> bool:
-    skills = person.get("skills") or []
-    for skill in skills:
-        if skill.get("id") != skill_id:
-            continue
-        level = skill.get("level")
-        if min_level is None:
-            return True
-        if level is None:
-            continue
-        try:
-            if int(level) >= int(min_level):
-                return True
-        except (TypeError, ValueError):
-            continue
-    return False
+    idx = _people_index(client)
+    return [p["id"] for p in idx.select(idx.by_team.get(team_id, []), include_archived)]
 
 
 mcp = FastMCP("Runn MCP Server", json_response=True)
 
 
+def _offload(func: Callable[..., object]) -> Callable[..., Awaitable[object]]:
+    """Run a blocking tool body in a worker thread so concurrent tool calls don't stall the event loop."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: object, **kwargs: object) -> object:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
 @mcp.tool()
+@_offload
 def list_projects(api_key: Optional[str] = None) -> List[Dict[str, object]]:
     """List all projects (id, name)."""
     client = get_client(api_key)
-    return [{"id": pid, "name": name} for pid, name in sorted(client.projects_lookup().items())]
+    return list(_sorted_projects(client))
 
 
 @mcp.tool()
+@_offload
 def list_people(
     full: bool = False,
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
+    output_format: str = "json",
     api_key: Optional[str] = None,
 ) -> object:
-    """List people. Default returns {id, name, email}; set full=True for raw API objects."""
+    """List people. Default returns {id, name, email}; set full=True for raw API objects.
+
+    output_format="ndjson" returns one JSON object per line.
+    """
+    _check_output_format(output_format)
     client = get_client(api_key)
     people_raw = _list_endpoint(client, "/people", params=params, paginate=paginate, limit=limit)
     if full:
-        return people_raw
+        return _render_rows(people_raw, output_format)
 
-    return [
+    people = [
         {"id": p["id"], "name": f"{p.get('firstName', '')} {p.get('lastName', '')}".strip(), "email": p.get("email")}
         for p in people_raw
     ]
+    return _render_rows(people, output_format)
 
 
 @mcp.tool()
+@_offload
 def billable_hours(
     start: Optional[str] = None,
     end: Optional[str] = None,
@@ -214,23 +651,25 @@ def billable_hours(
 ) -> List[Dict[str, object]]:
     """Aggregate billable hours grouped by project/person/month."""
     client = get_client(api_key)
-    rows = build_billable_hours_report(client, start=parse_date(start), end=parse_date(end))
-
-    def matches(row: Dict[str, object]) -> bool:
-        if project_id and row["project_id"] != project_id:
-            return False
-        if person_id and row["person_id"] != person_id:
-            return False
-        return True
-
-    return [row for row in rows if matches(row)]
+    return list(
+        build_billable_hours_report(
+            client,
+            start=parse_date(start),
+            end=parse_date(end),
+            project_id=project_id,
+            person_id=person_id,
+            people_lookup=functools.partial(_person_names, client),
+            projects_lookup=functools.partial(_project_names, client),
+        )
+    )
 
 
 @mcp.tool()
+@_offload
 def list_clients(
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
     api_key: Optional[str] = None,
 ) -> object:
     """List clients (raw API objects)."""
@@ -239,18 +678,23 @@ def list_clients(
 
 
 @mcp.tool()
+@_offload
 def list_assignments(
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
+    output_format: str = "json",
     api_key: Optional[str] = None,
 ) -> object:
-    """List assignments (raw API objects)."""
+    """List assignments (raw API objects). output_format="ndjson" returns one JSON object per line."""
+    _check_output_format(output_format)
     client = get_client(api_key)
-    return _list_endpoint(client, "/assignments", params=params, paginate=paginate, limit=limit)
+    rows = _list_endpoint(client, "/assignments", params=params, paginate=paginate, limit=limit)
+    return _render_rows(rows, output_format)
 
 
 @mcp.tool()
+@_offload
 def list_assignments_by_person(
     person_id: int,
     start: Optional[str] = None,
@@ -260,26 +704,11 @@ def list_assignments_by_person(
 ) -> List[Dict[str, object]]:
     """List assignments for a person, optionally filtered by date range."""
     client = get_client(api_key)
-    assignments = _list_endpoint(client, "/assignments", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in assignments:
-        if a.get("personId") != person_id:
-            continue
-        if active_only and not a.get("isActive", False):
-            continue
-        if start_date or end_date:
-            a_start = _to_date(a.get("startDate"))
-            a_end = _to_date(a.get("endDate"))
-            if not _range_overlaps(a_start, a_end, start_date, end_date):
-                continue
-        results.append(a)
-    return results
+    return _query(client, "/assignments", start, end, active_only=active_only, person_id=person_id)
 
 
 @mcp.tool()
+@_offload
 def list_assignments_by_project(
     project_id: int,
     start: Optional[str] = None,
@@ -289,26 +718,11 @@ def list_assignments_by_project(
 ) -> List[Dict[str, object]]:
     """List assignments for a project, optionally filtered by date range."""
     client = get_client(api_key)
-    assignments = _list_endpoint(client, "/assignments", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in assignments:
-        if a.get("projectId") != project_id:
-            continue
-        if active_only and not a.get("isActive", False):
-            continue
-        if start_date or end_date:
-            a_start = _to_date(a.get("startDate"))
-            a_end = _to_date(a.get("endDate"))
-            if not _range_overlaps(a_start, a_end, start_date, end_date):
-                continue
-        results.append(a)
-    return results
+    return _query(client, "/assignments", start, end, active_only=active_only, project_id=project_id)
 
 
 @mcp.tool()
+@_offload
 def list_assignments_by_role(
     role_id: int,
     start: Optional[str] = None,
@@ -318,26 +732,11 @@ def list_assignments_by_role(
 ) -> List[Dict[str, object]]:
     """List assignments for a role, optionally filtered by date range."""
     client = get_client(api_key)
-    assignments = _list_endpoint(client, "/assignments", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in assignments:
-        if a.get("roleId") != role_id:
-            continue
-        if active_only and not a.get("isActive", False):
-            continue
-        if start_date or end_date:
-            a_start = _to_date(a.get("startDate"))
-            a_end = _to_date(a.get("endDate"))
-            if not _range_overlaps(a_start, a_end, start_date, end_date):
-                continue
-        results.append(a)
-    return results
+    return _query(client, "/assignments", start, end, active_only=active_only, role_id=role_id)
 
 
 @mcp.tool()
+@_offload
 def list_assignments_by_team(
     team_id: int,
     start: Optional[str] = None,
@@ -348,39 +747,28 @@ def list_assignments_by_team(
 ) -> List[Dict[str, object]]:
     """List assignments for all people in a team, optionally filtered by date range."""
     client = get_client(api_key)
-    person_ids = set(_people_ids_for_team(client, team_id, include_archived=include_archived))
-    assignments = _list_endpoint(client, "/assignments", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in assignments:
-        if a.get("personId") not in person_ids:
-            continue
-        if active_only and not a.get("isActive", False):
-            continue
-        if start_date or end_date:
-            a_start = _to_date(a.get("startDate"))
-            a_end = _to_date(a.get("endDate"))
-            if not _range_overlaps(a_start, a_end, start_date, end_date):
-                continue
-        results.append(a)
-    return results
+    person_ids = frozenset(_people_ids_for_team(client, team_id, include_archived=include_archived))
+    return _query(client, "/assignments", start, end, active_only=active_only, person_ids=person_ids)
 
 
 @mcp.tool()
+@_offload
 def list_actuals(
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
+    output_format: str = "json",
     api_key: Optional[str] = None,
 ) -> object:
-    """List actuals (raw API objects)."""
+    """List actuals (raw API objects). output_format="ndjson" returns one JSON object per line."""
+    _check_output_format(output_format)
     client = get_client(api_key)
-    return _list_endpoint(client, "/actuals", params=params, paginate=paginate, limit=limit)
+    rows = _list_endpoint(client, "/actuals", params=params, paginate=paginate, limit=limit)
+    return _render_rows(rows, output_format)
 
 
 @mcp.tool()
+@_offload
 def list_actuals_by_date_range(
     start: str,
     end: str,
@@ -390,23 +778,12 @@ def list_actuals_by_date_range(
 ) -> List[Dict[str, object]]:
     """List actuals within a date range, optionally filtered by person/project."""
     client = get_client(api_key)
-    actuals = _list_endpoint(client, "/actuals", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in actuals:
-        if person_id is not None and a.get("personId") != person_id:
-            continue
-        if project_id is not None and a.get("projectId") != project_id:
-            continue
-        if not _in_range(_to_date(a.get("date")), start_date, end_date):
-            continue
-        results.append(a)
-    return results
+    # Unlike the other actuals tools, an undated actual never falls in a date range, even an open one.
+    return _query(client, "/actuals", start, end, dated_only=True, person_id=person_id, project_id=project_id)
 
 
 @mcp.tool()
+@_offload
 def list_actuals_by_person(
     person_id: int,
     start: Optional[str] = None,
@@ -415,22 +792,11 @@ def list_actuals_by_person(
 ) -> List[Dict[str, object]]:
     """List actuals for a person, optionally filtered by date range."""
     client = get_client(api_key)
-    actuals = _list_endpoint(client, "/actuals", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in actuals:
-        if a.get("personId") != person_id:
-            continue
-        if start_date or end_date:
-            if not _in_range(_to_date(a.get("date")), start_date, end_date):
-                continue
-        results.append(a)
-    return results
+    return _query(client, "/actuals", start, end, person_id=person_id)
 
 
 @mcp.tool()
+@_offload
 def list_actuals_by_project(
     project_id: int,
     start: Optional[str] = None,
@@ -439,22 +805,11 @@ def list_actuals_by_project(
 ) -> List[Dict[str, object]]:
     """List actuals for a project, optionally filtered by date range."""
     client = get_client(api_key)
-    actuals = _list_endpoint(client, "/actuals", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in actuals:
-        if a.get("projectId") != project_id:
-            continue
-        if start_date or end_date:
-            if not _in_range(_to_date(a.get("date")), start_date, end_date):
-                continue
-        results.append(a)
-    return results
+    return _query(client, "/actuals", start, end, project_id=project_id)
 
 
 @mcp.tool()
+@_offload
 def list_actuals_by_role(
     role_id: int,
     start: Optional[str] = None,
@@ -463,22 +818,11 @@ def list_actuals_by_role(
 ) -> List[Dict[str, object]]:
     """List actuals for a role, optionally filtered by date range."""
     client = get_client(api_key)
-    actuals = _list_endpoint(client, "/actuals", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in actuals:
-        if a.get("roleId") != role_id:
-            continue
-        if start_date or end_date:
-            if not _in_range(_to_date(a.get("date")), start_date, end_date):
-                continue
-        results.append(a)
-    return results
+    return _query(client, "/actuals", start, end, role_id=role_id)
 
 
 @mcp.tool()
+@_offload
 def list_actuals_by_team(
     team_id: int,
     start: Optional[str] = None,
@@ -488,27 +832,16 @@ def list_actuals_by_team(
 ) -> List[Dict[str, object]]:
     """List actuals for all people in a team, optionally filtered by date range."""
     client = get_client(api_key)
-    person_ids = set(_people_ids_for_team(client, team_id, include_archived=include_archived))
-    actuals = _list_endpoint(client, "/actuals", paginate=True)
-    start_date = _to_date(start)
-    end_date = _to_date(end)
-
-    results = []
-    for a in actuals:
-        if a.get("personId") not in person_ids:
-            continue
-        if start_date or end_date:
-            if not _in_range(_to_date(a.get("date")), start_date, end_date):
-                continue
-        results.append(a)
-    return results
+    person_ids = frozenset(_people_ids_for_team(client, team_id, include_archived=include_archived))
+    return _query(client, "/actuals", start, end, person_ids=person_ids)
 
 
 @mcp.tool()
+@_offload
 def list_roles(
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
     api_key: Optional[str] = None,
 ) -> object:
     """List roles (raw API objects)."""
@@ -517,18 +850,20 @@ def list_roles(
 
 
 @mcp.tool()
+@_offload
 def list_roles_by_person(person_id: int, api_key: Optional[str] = None) -> List[Dict[str, object]]:
     """List roles that include the given person_id."""
     client = get_client(api_key)
-    roles = _list_endpoint(client, "/roles", paginate=True)
+    roles = _iter_endpoint(client, "/roles")
     return [r for r in roles if person_id in (r.get("personIds") or [])]
 
 
 @mcp.tool()
+@_offload
 def list_skills(
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
     api_key: Optional[str] = None,
 ) -> object:
     """List skills (raw API objects)."""
@@ -537,33 +872,29 @@ def list_skills(
 
 
 @mcp.tool()
+@_offload
 def list_skills_by_person(person_id: int, api_key: Optional[str] = None) -> List[Dict[str, object]]:
     """List skills for a person with level and name (if available)."""
     client = get_client(api_key)
-    people = _list_endpoint(client, "/people", paginate=True)
+    people = _iter_endpoint(client, "/people")
     person = next((p for p in people if p.get("id") == person_id), None)
     if not person:
         raise ValueError(f"Person {person_id} not found.")
 
-    skill_entries = person.get("skills") or []
-    skill_ids = {s.get("id") for s in skill_entries if s.get("id") is not None}
-    skills = _list_endpoint(client, "/skills", paginate=True)
-    skill_name_by_id = {s.get("id"): s.get("name") for s in skills}
-
-    results = []
-    for s in skill_entries:
-        sid = s.get("id")
-        if sid not in skill_ids:
-            continue
-        results.append({"id": sid, "name": skill_name_by_id.get(sid), "level": s.get("level")})
-    return results
+    skill_name_by_id = _skill_names(client)
+    return [
+        {"id": s["id"], "name": skill_name_by_id.get(s["id"]), "level": s.get("level")}
+        for s in person.get("skills") or []
+        if s.get("id") is not None
+    ]
 
 
 @mcp.tool()
+@_offload
 def list_teams(
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
     api_key: Optional[str] = None,
 ) -> object:
     """List teams (raw API objects)."""
@@ -572,6 +903,7 @@ def list_teams(
 
 
 @mcp.tool()
+@_offload
 def list_people_by_team(
     team_id: int,
     include_archived: bool = False,
@@ -579,18 +911,12 @@ def list_people_by_team(
 ) -> List[Dict[str, object]]:
     """List people in a team."""
     client = get_client(api_key)
-    people = _list_endpoint(client, "/people", paginate=True)
-    results = []
-    for p in people:
-        if p.get("teamId") != team_id:
-            continue
-        if not include_archived and p.get("isArchived"):
-            continue
-        results.append(p)
-    return results
+    idx = _people_index(client)
+    return idx.select(idx.by_team.get(team_id, []), include_archived)
 
 
 @mcp.tool()
+@_offload
 def list_people_by_skill(
     skill_id: int,
     min_level: Optional[int] = None,
@@ -599,17 +925,13 @@ def list_people_by_skill(
 ) -> List[Dict[str, object]]:
     """List people who have a specific skill (optionally at/above min_level)."""
     client = get_client(api_key)
-    people = _list_endpoint(client, "/people", paginate=True)
-    results = []
-    for p in people:
-        if not include_archived and p.get("isArchived"):
-            continue
-        if _person_has_skill(p, skill_id=skill_id, min_level=min_level):
-            results.append(p)
-    return results
+    idx = _people_index(client)
+    entries = idx.by_skill.get(skill_id, [])
+    return idx.select((i for i, level in entries if _meets_level(level, min_level)), include_archived)
 
 
 @mcp.tool()
+@_offload
 def list_people_by_tag(
     tag_id: Optional[int] = None,
     tag_name: Optional[str] = None,
@@ -620,17 +942,15 @@ def list_people_by_tag(
     if tag_id is None and tag_name is None:
         raise ValueError("Provide tag_id or tag_name.")
     client = get_client(api_key)
-    people = _list_endpoint(client, "/people", paginate=True)
-    results = []
-    for p in people:
-        if not include_archived and p.get("isArchived"):
-            continue
-        if _person_has_tag(p, tag_id=tag_id, tag_name=tag_name):
-            results.append(p)
-    return results
+    idx = _people_index(client)
+    positions = list(idx.by_tag_id.get(tag_id, [])) if tag_id is not None else []
+    if isinstance(tag_name, str) and tag_name:
+        positions.extend(idx.by_tag_name.get(tag_name.lower(), []))
+    return idx.select(positions, include_archived)
 
 
 @mcp.tool()
+@_offload
 def list_people_by_manager(
     manager_id: int,
     include_archived: bool = False,
@@ -638,22 +958,16 @@ def list_people_by_manager(
 ) -> List[Dict[str, object]]:
     """List people managed by a given manager id."""
     client = get_client(api_key)
-    people = _list_endpoint(client, "/people", paginate=True)
-    results = []
-    for p in people:
-        if not include_archived and p.get("isArchived"):
-            continue
-        managers = p.get("managers") or []
-        if any(m.get("id") == manager_id for m in managers):
-            results.append(p)
-    return results
+    idx = _people_index(client)
+    return idx.select(idx.by_manager.get(manager_id, []), include_archived)
 
 
 @mcp.tool()
+@_offload
 def list_rate_cards(
     params: Optional[Dict[str, object]] = None,
     paginate: bool = True,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
     api_key: Optional[str] = None,
 ) -> object:
     """List rate cards (raw API objects)."""
@@ -662,30 +976,47 @@ def list_rate_cards(
 
 
 @mcp.tool()
+@_offload
 def list_rate_cards_by_project(project_id: int, api_key: Optional[str] = None) -> List[Dict[str, object]]:
     """List rate cards that include the given project_id."""
     client = get_client(api_key)
-    rate_cards = _list_endpoint(client, "/rate-cards", paginate=True)
+    rate_cards = _iter_endpoint(client, "/rate-cards")
     return [rc for rc in rate_cards if project_id in (rc.get("projectIds") or [])]
 
 
 @mcp.tool()
+@_offload
 def runn_request(
     method: str,
     path: str,
     params: Optional[Dict[str, object]] = None,
     json_body: Optional[Dict[str, object]] = None,
     paginate: bool = False,
-    limit: int = 200,
+    limit: int = DEFAULT_PAGE_SIZE,
     api_key: Optional[str] = None,
 ) -> object:
-    """Call any Runn API endpoint and return the JSON response."""
+    """Call any Runn API endpoint and return the JSON response.
+
+    Any non-GET request drops every cached list and index, so later reads see the write.
+    """
     client = get_client(api_key)
     if paginate:
         if method.upper() != "GET":
             raise ValueError("paginate=True only supports GET requests.")
         return list(client.paginate(path, params=params, limit=limit))
-    return client.request(method, path, params=params, json_body=json_body)
+    if method.upper() == "GET":
+        return client.request(method, path, params=params, json_body=json_body)
+    try:
+        return client.request(method, path, params=params, json_body=json_body)
+    finally:
+        # Cleared even when the request fails, since the write may still have been applied.
+        _list_cache.clear()
+
+
+@mcp.tool()
+def cache_clear() -> Dict[str, int]:
+    """Drop all cached list responses so the next call refetches from Runn."""
+    return {"cleared": _list_cache.clear()}
 
 
 if __name__ == "__main__":